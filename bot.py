@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 # bot.py
 
-import os, logging
+import io, os, logging
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request
 from telegram import Bot, Update, InlineKeyboardButton, InlineKeyboardMarkup, InputFile
 from telegram import ParseMode
@@ -12,7 +13,7 @@ from hianimez_scraper import (
     get_episodes_list,
     extract_episode_stream_and_subtitle
 )
-from utils import download_and_rename_subtitle
+from utils import fetch_subtitle_bytes
 
 # -------------------------
 # Env & logging
@@ -38,6 +39,11 @@ app = Flask(__name__)
 bot = Bot(token=TELEGRAM_TOKEN)
 dispatcher = Dispatcher(bot, None, workers=4, use_context=True)  # PTB v13.x style
 
+# Scraping (Playwright render, cloudscraper GETs) can block for seconds;
+# run it on a dedicated pool so the 4 Dispatcher workers stay free to
+# answer new updates.
+scrape_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="scrape")
+
 # -------------------------
 # Handlers
 # -------------------------
@@ -56,20 +62,24 @@ def search_command(update: Update, context: CallbackContext):
 
     query = " ".join(context.args).strip()
     msg = update.message.reply_text(f"🔍 Searching for \"{query}\"…")
-    try:
-        results = search_anime(query)
-    except Exception as e:
-        logger.exception("Search error")
-        msg.edit_text("❌ Error during search; please try again.")
-        return
 
-    if not results:
-        msg.edit_text(f"No anime found for \"{query}\".")
-        return
+    def _done(fut):
+        try:
+            results = fut.result()
+        except Exception:
+            logger.exception("Search error")
+            msg.edit_text("❌ Error during search; please try again.")
+            return
+
+        if not results:
+            msg.edit_text(f"No anime found for \"{query}\".")
+            return
 
-    buttons = [[InlineKeyboardButton(title, callback_data=f"anime|{anime_url}")]
-               for (title, anime_url, _) in results]
-    msg.edit_text("Select the anime:", reply_markup=InlineKeyboardMarkup(buttons))
+        buttons = [[InlineKeyboardButton(title, callback_data=f"anime|{anime_url}")]
+                   for (title, anime_url, _) in results]
+        msg.edit_text("Select the anime:", reply_markup=InlineKeyboardMarkup(buttons))
+
+    scrape_executor.submit(search_anime, query).add_done_callback(_done)
 
 def anime_callback(update: Update, context: CallbackContext):
     query = update.callback_query
@@ -82,24 +92,28 @@ def anime_callback(update: Update, context: CallbackContext):
         return
 
     query.edit_message_text("📺 Loading episodes…")
-    try:
-        episodes = get_episodes_list(anime_url)
-    except Exception:
-        logger.exception("Episode list fetch error")
-        query.edit_message_text("❌ Failed to retrieve episodes.")
-        return
 
-    if not episodes:
-        query.edit_message_text("No episodes found.")
-        return
+    def _done(fut):
+        try:
+            episodes = fut.result()
+        except Exception:
+            logger.exception("Episode list fetch error")
+            query.edit_message_text("❌ Failed to retrieve episodes.")
+            return
 
-    # Build episode buttons (chunk to avoid exceeding Telegram button limits)
-    rows = []
-    for ep_num, ep_url in episodes:
-        label = f"Ep {ep_num}"
-        rows.append([InlineKeyboardButton(label, callback_data=f"ep|{ep_num}|{ep_url}")])
+        if not episodes:
+            query.edit_message_text("No episodes found.")
+            return
 
-    query.edit_message_text("Choose an episode:", reply_markup=InlineKeyboardMarkup(rows))
+        # Build episode buttons (chunk to avoid exceeding Telegram button limits)
+        rows = []
+        for ep_num, ep_url in episodes:
+            label = f"Ep {ep_num}"
+            rows.append([InlineKeyboardButton(label, callback_data=f"ep|{ep_num}|{ep_url}")])
+
+        query.edit_message_text("Choose an episode:", reply_markup=InlineKeyboardMarkup(rows))
+
+    scrape_executor.submit(get_episodes_list, anime_url).add_done_callback(_done)
 
 def episode_callback(update: Update, context: CallbackContext):
     query = update.callback_query
@@ -113,13 +127,18 @@ def episode_callback(update: Update, context: CallbackContext):
 
     query.edit_message_text(f"🔄 Getting SUB: HD‑2 + English subtitle for Episode {ep_num}…")
 
-    try:
-        hls_link, subtitle_url = extract_episode_stream_and_subtitle(ep_url)
-    except Exception:
-        logger.exception("Extract error")
-        query.edit_message_text(f"❌ Failed to extract data for Episode {ep_num}.")
-        return
+    def _done(fut):
+        try:
+            hls_link, subtitle_url = fut.result()
+        except Exception:
+            logger.exception("Extract error")
+            query.edit_message_text(f"❌ Failed to extract data for Episode {ep_num}.")
+            return
+        _send_episode_result(query, ep_num, hls_link, subtitle_url)
 
+    scrape_executor.submit(extract_episode_stream_and_subtitle, ep_url).add_done_callback(_done)
+
+def _send_episode_result(query, ep_num, hls_link, subtitle_url):
     if not hls_link:
         query.edit_message_text("😔 No SUB: HD‑2 stream found for this episode.")
         return
@@ -134,28 +153,22 @@ def episode_callback(update: Update, context: CallbackContext):
         query.edit_message_text(text, parse_mode=ParseMode.HTML)
         return
 
-    # Download and send the English subtitle as file
+    # Download and send the English subtitle as file (in memory, no disk)
     try:
-        local_vtt = download_and_rename_subtitle(subtitle_url, ep_num, cache_dir="subtitles_cache")
+        subtitle_bytes = fetch_subtitle_bytes(subtitle_url)
     except Exception:
         logger.exception("Subtitle download error")
         text += "⚠️ Found English subtitle URL but failed to download."
         query.edit_message_text(text, parse_mode=ParseMode.HTML)
         return
 
-    text += f"✅ English subtitle saved as `Episode {ep_num}.vtt`."
+    text += f"✅ English subtitle sent as `Episode {ep_num}.vtt`."
     query.edit_message_text(text, parse_mode=ParseMode.HTML)
 
-    with open(local_vtt, "rb") as f:
-        query.message.reply_document(
-            document=InputFile(f, filename=f"Episode {ep_num}.vtt"),
-            caption=f"Here is the subtitle for Episode {ep_num}."
-        )
-
-    try:
-        os.remove(local_vtt)
-    except OSError:
-        pass
+    query.message.reply_document(
+        document=InputFile(io.BytesIO(subtitle_bytes), filename=f"Episode {ep_num}.vtt"),
+        caption=f"Here is the subtitle for Episode {ep_num}."
+    )
 
 # Register handlers
 dispatcher.add_handler(CommandHandler("start", start))
@@ -188,7 +201,6 @@ if __name__ == "__main__":
         logger.exception("Failed to set webhook")
         raise
 
-    os.makedirs("subtitles_cache", exist_ok=True)
     PORT = int(os.getenv("PORT", "8080"))
     logger.info(f"Starting Flask on :{PORT}")
     app.run(host="0.0.0.0", port=PORT)
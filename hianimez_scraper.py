@@ -1,33 +1,86 @@
 # hianimez_scraper.py
-import re, asyncio, time
-from urllib.parse import urljoin, urlparse, quote_plus
+import re, asyncio, functools, json, threading, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, urlparse
 from typing import List, Tuple, Optional
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # Optional fast parser; fall back to bs4 with a strainer so we only
+    # parse the subtrees we actually select from.
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    _STRAINER_CLASS_RE = re.compile(r"film-poster|film-list-wrap|episodes|episode-list")
+
+    def _strainer_class_ok(value) -> bool:
+        if value is None:
+            return True
+        if isinstance(value, (list, tuple)):
+            value = " ".join(value)
+        return bool(_STRAINER_CLASS_RE.search(value))
+
+    _PARSE_STRAINER = SoupStrainer(
+        ["div", "ul", "a"],
+        attrs={"class": _strainer_class_ok},
+    )
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 import cloudscraper
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import HIANIME_DOMAIN_POOL, COMMON_HEADERS, HTTP_TIMEOUT, RETRIES
 
 # ------------------------
 # Domain selection helpers
 # ------------------------
-def _pick_live_base() -> str:
+# The live mirror rarely changes mid-session, so remember it for a while
+# instead of re-probing the whole pool on every command.
+_BASE_CACHE = {"base": None, "ts": 0.0}
+_BASE_CACHE_TTL = 600  # seconds
+_BASE_CACHE_LOCK = threading.Lock()
+
+def _probe_live_base() -> str:
     """
-    Try domains in HIANIME_DOMAIN_POOL and return the first that responds 200
-    for the home page. Falls back to the first in the list if all fail.
+    Probe all domains in HIANIME_DOMAIN_POOL concurrently and return the
+    first that responds OK for the home page. Falls back to the first in
+    the list if all fail.
     """
     sess = requests.Session()
     sess.headers.update(COMMON_HEADERS)
-    for base in HIANIME_DOMAIN_POOL:
-        try:
-            r = sess.get(base, timeout=10)
-            if r.status_code < 500:
-                return base.rstrip("/")
-        except Exception:
-            continue
-    return HIANIME_DOMAIN_POOL[0].rstrip("/")
+    # No context manager: its shutdown(wait=True) would block on the
+    # slowest probe even after a mirror has already answered.
+    ex = ThreadPoolExecutor(max_workers=len(HIANIME_DOMAIN_POOL))
+    try:
+        futs = {ex.submit(sess.get, base, timeout=5): base for base in HIANIME_DOMAIN_POOL}
+        for fut in as_completed(futs):
+            try:
+                if fut.result().status_code < 500:
+                    return futs[fut].rstrip("/")
+            except Exception:
+                continue
+        return HIANIME_DOMAIN_POOL[0].rstrip("/")
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
+
+def _pick_live_base() -> str:
+    """
+    Return the cached live base, re-probing only when the cache is cold
+    or older than _BASE_CACHE_TTL.
+    """
+    with _BASE_CACHE_LOCK:
+        if _BASE_CACHE["base"] and time.time() - _BASE_CACHE["ts"] < _BASE_CACHE_TTL:
+            return _BASE_CACHE["base"]
+    base = _probe_live_base()
+    with _BASE_CACHE_LOCK:
+        _BASE_CACHE["base"] = base
+        _BASE_CACHE["ts"] = time.time()
+    return base
+
+def _invalidate_base_cache() -> None:
+    with _BASE_CACHE_LOCK:
+        _BASE_CACHE["base"] = None
 
 def _base_of(url: str) -> str:
     """
@@ -47,27 +100,186 @@ def _abs(base: str, maybe_rel: str) -> str:
 # ------------------------
 # Playwright-rendered fetch
 # ------------------------
-async def _fetch_rendered_html(url: str) -> str:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(args=["--no-sandbox"])
-        page = await browser.new_page()
-        await page.set_extra_http_headers({"User-Agent": COMMON_HEADERS["User-Agent"]})
-        await page.goto(url, wait_until="domcontentloaded", timeout=45000)
-        # tiny delay for dynamic lists
+# One Chromium instance is launched lazily on a long-lived background loop
+# and reused for every fetch; each fetch gets its own throwaway context.
+_PW_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_PW_LOOP_LOCK = threading.Lock()
+_playwright = None
+_browser = None
+
+def _playwright_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop that owns the persistent Playwright instance,
+    starting its daemon thread on first use.
+    """
+    global _PW_LOOP
+    with _PW_LOOP_LOCK:
+        if _PW_LOOP is None:
+            _PW_LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_PW_LOOP.run_forever, name="playwright-loop", daemon=True
+            ).start()
+    return _PW_LOOP
+
+# Cap simultaneous BrowserContexts so a burst of requests cannot blow up
+# the shared browser's memory. Created lazily so it binds to the loop above.
+_PW_MAX_CONTEXTS = 4
+_PW_SEM: Optional[asyncio.Semaphore] = None
+
+def _pw_semaphore() -> asyncio.Semaphore:
+    global _PW_SEM
+    if _PW_SEM is None:
+        _PW_SEM = asyncio.Semaphore(_PW_MAX_CONTEXTS)
+    return _PW_SEM
+
+# Serializes the lazy launch: several coroutines can hit _ensure_browser
+# between awaits and would otherwise each start their own Chromium.
+# Created lazily so it binds to the Playwright loop.
+_PW_BROWSER_LOCK: Optional[asyncio.Lock] = None
+
+async def _ensure_browser():
+    """
+    Launch Chromium once and keep it alive; relaunch if it died.
+    """
+    global _playwright, _browser, _PW_BROWSER_LOCK
+    if _PW_BROWSER_LOCK is None:
+        _PW_BROWSER_LOCK = asyncio.Lock()
+    async with _PW_BROWSER_LOCK:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(args=["--no-sandbox"])
+        return _browser
+
+# Scraping only needs the HTML and inline script blobs; images, ads and
+# styling are dead weight on these pages.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+_AD_HOST_RE = re.compile(
+    r"doubleclick|googlesyndication|adservice|google-analytics|exoclick"
+    r"|juicyads|popads|propellerads|taboola|outbrain",
+    re.I,
+)
+
+async def _route_filter(route):
+    req = route.request
+    if req.resource_type in _BLOCKED_RESOURCE_TYPES or _AD_HOST_RE.search(req.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def _fetch_rendered_html(url: str, wait_until: str = "domcontentloaded") -> str:
+    async with _pw_semaphore():
+        browser = await _ensure_browser()
+        ctx = await browser.new_context(user_agent=COMMON_HEADERS["User-Agent"])
         try:
-            await page.wait_for_timeout(800)
-        except:
-            pass
-        html = await page.content()
-        await browser.close()
-        return html
+            page = await ctx.new_page()
+            # Fail fast: a slow mirror should surface quickly so we can rotate,
+            # not block the user for the old 45 s navigation timeout.
+            page.set_default_navigation_timeout(12000)
+            page.set_default_timeout(4000)
+            await page.route("**/*", _route_filter)
+            await page.goto(url, wait_until=wait_until)
+            # wait for the result cards rather than sleeping a fixed delay
+            try:
+                await page.wait_for_selector("div.film-poster a[href]", timeout=5000)
+            except:
+                pass
+            return await page.content()
+        finally:
+            await ctx.close()
 
-def _rendered_html(url: str) -> str:
-    loop = asyncio.new_event_loop()
+def _run_rendered_fetch(fetch, url: str) -> str:
+    loop = _playwright_loop()
     try:
-        return loop.run_until_complete(_fetch_rendered_html(url))
-    finally:
-        loop.close()
+        return asyncio.run_coroutine_threadsafe(fetch(url), loop).result(timeout=60)
+    except PlaywrightTimeoutError:
+        # Mirror is slow or dead: probe a fresh base and retry once with the
+        # same path on the new mirror, not the host that just timed out.
+        _invalidate_base_cache()
+        retry_netloc = urlparse(_pick_live_base()).netloc
+        retry_url = urlparse(url)._replace(netloc=retry_netloc).geturl()
+        return asyncio.run_coroutine_threadsafe(fetch(retry_url), loop).result(timeout=60)
+
+def _rendered_html(url: str, wait_until: str = "domcontentloaded") -> str:
+    return _run_rendered_fetch(
+        lambda u: _fetch_rendered_html(u, wait_until=wait_until), url
+    )
+
+def _rendered_episodes_html(url: str) -> str:
+    return _run_rendered_fetch(_fetch_episodes_html, url)
+
+# ------------------------
+# Anchor extraction (selectolax primary, bs4+strainer fallback)
+# ------------------------
+def _search_anchors(html: str) -> List[Tuple[str, str]]:
+    """
+    Return (href, title) pairs for the search-result cards in html.
+    """
+    out = []
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        anchors = (
+            tree.css("div.film-list-wrap div.film-poster a[href]")
+            or tree.css("div.film-poster a[href]")
+        )
+        for a in anchors:
+            # .attributes builds a fresh dict per access; grab it once.
+            attrs = a.attributes
+            href = (attrs.get("href") or "").strip()
+            if not href:
+                continue
+            title = attrs.get("title") or a.text(strip=True) or "Unknown"
+            out.append((href, title))
+        return out
+
+    soup = BeautifulSoup(html, "lxml", parse_only=_PARSE_STRAINER)
+    container = soup.find("div", class_="film-list-wrap") or soup
+    for a in container.select("div.film-poster a[href]"):
+        href = a.get("href", "").strip()
+        if not href:
+            continue
+        title = a.get("title") or a.get_text(strip=True) or "Unknown"
+        out.append((href, title))
+    return out
+
+def _episode_anchors(html: str) -> List[Tuple[str, str]]:
+    """
+    Return (href, link_text) pairs for the episode list in html.
+    """
+    container_sels = ["ul.episodes", "div.episode-list", "div#episodes", "div#episode_page"]
+    out = []
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        candidates = []
+        for sel in container_sels:
+            candidates = tree.css(f"{sel} a[href]")
+            if candidates:
+                break
+        if not candidates:
+            candidates = tree.css("a[href*='episode']")
+        for a in candidates:
+            href = (a.attributes.get("href") or "").strip()
+            if not href:
+                continue
+            out.append((href, a.text(separator=" ", strip=True)))
+        return out
+
+    soup = BeautifulSoup(html, "lxml", parse_only=_PARSE_STRAINER)
+    candidates = []
+    for sel in container_sels:
+        container = soup.select_one(sel)
+        if container:
+            candidates = container.select("a[href]")
+            if candidates:
+                break
+    if not candidates:
+        candidates = soup.select("a[href*='episode']")
+    for a in candidates:
+        href = a.get("href", "").strip()
+        if not href:
+            continue
+        out.append((href, a.get_text(" ", strip=True)))
+    return out
 
 # ------------------------
 # 1) SEARCH
@@ -77,19 +289,20 @@ def search_anime(query: str) -> List[Tuple[str, str, str]]:
     Returns list of tuples: (title, anime_url, anime_url)
     """
     base = _pick_live_base()
-    url = f"{base}/search?keyword={quote_plus(query)}"
-    html = _rendered_html(url)
+    url = requests.Request("GET", f"{base}/search", params={"keyword": query}).prepare().url
+    # The search listing is server-rendered; a plain GET is ~100x cheaper
+    # than Chromium, so only render when the cheap fetch looks wrong.
+    html = ""
+    try:
+        html = _get_with_retries(_scraper_session(), url)
+    except Exception:
+        html = ""
+    if "film-poster" not in html:
+        html = _rendered_html(url, wait_until="commit")
 
-    soup = BeautifulSoup(html, "lxml")
     results = []
-    container = soup.find("div", class_="film-list-wrap") or soup
-    for a in container.select("div.film-poster a[href]"):
-        rel_link = a.get("href", "").strip()
-        if not rel_link:
-            continue
-        anime_url = _abs(base, rel_link)
-        # try to get title
-        title = a.get("title") or a.get_text(strip=True) or "Unknown"
+    for href, title in _search_anchors(html):
+        anime_url = _abs(base, href)
         results.append((title, anime_url, anime_url))
     return results
 
@@ -97,70 +310,156 @@ def search_anime(query: str) -> List[Tuple[str, str, str]]:
 # 2) EPISODE LIST
 # ------------------------
 async def _fetch_episodes_html(anime_url: str) -> str:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(args=["--no-sandbox"])
-        page = await browser.new_page()
-        await page.set_extra_http_headers({"User-Agent": COMMON_HEADERS["User-Agent"]})
-        await page.goto(anime_url, wait_until="domcontentloaded", timeout=45000)
-        # Try common containers
-        for sel in ["ul.episodes", "div.episode-list", "div#episodes", "div#episode_page"]:
-            try:
-                await page.wait_for_selector(sel, timeout=15000)
-                break
-            except:
-                continue
-        html = await page.content()
-        await browser.close()
-        return html
+    async with _pw_semaphore():
+        browser = await _ensure_browser()
+        ctx = await browser.new_context(user_agent=COMMON_HEADERS["User-Agent"])
+        try:
+            page = await ctx.new_page()
+            page.set_default_navigation_timeout(12000)
+            page.set_default_timeout(4000)
+            await page.route("**/*", _route_filter)
+            await page.goto(anime_url, wait_until="domcontentloaded")
+            # Try common containers
+            for sel in ["ul.episodes", "div.episode-list", "div#episodes", "div#episode_page"]:
+                try:
+                    await page.wait_for_selector(sel, timeout=4000)
+                    break
+                except:
+                    continue
+            return await page.content()
+        finally:
+            await ctx.close()
+
+# ------------------------
+# Result caching
+# ------------------------
+def _cacheable(value) -> bool:
+    # Don't remember failures: empty lists or all-None tuples should be retried.
+    if not value:
+        return False
+    if isinstance(value, tuple):
+        return any(v is not None for v in value)
+    return True
+
+def _ttl_cached(ttl: float):
+    """
+    Cache decorator for single-URL scrape functions. Keys on the URL with
+    only its fragment stripped (the query identifies the episode on these
+    mirrors, e.g. /watch/slug-100?ep=2), and expires entries after ttl
+    seconds.
+    """
+    def deco(fn):
+        cache = {}
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(url, *args, **kwargs):
+            key = urlparse(url)._replace(fragment="").geturl()
+            now = time.time()
+            with lock:
+                hit = cache.get(key)
+                if hit and now - hit[0] < ttl:
+                    return hit[1]
+            value = fn(url, *args, **kwargs)
+            if _cacheable(value):
+                with lock:
+                    cache[key] = (now, value)
+            return value
+
+        return wrapper
+    return deco
+
+# Anime pages end in a numeric slug id, e.g. /watch/one-piece-100
+_ANIME_ID_RE = re.compile(r"-(\d+)/?$")
+_RE_EP_TEXT = re.compile(r"Episode\s*([0-9]+)", re.I)
+_RE_EP_HREF = re.compile(r"episode[-_/ ]?(\d+)", re.I)
+# One C-level sweep over the raw HTML: anchor href plus the anchor body
+# (which may nest the "Episode N" label in child tags).
+_RE_EP_PAIR = re.compile(r'<a\b[^>]*?href="([^"]+)"[^>]*>(.*?)</a>', re.I | re.S)
+
+def _episodes_html(anime_url: str) -> Tuple[str, bool]:
+    """
+    Fetch the episode-list markup, cheapest source first: the AJAX episode
+    list endpoint (plain JSON GET), then a full rendered fetch. Returns
+    (html, is_fragment); is_fragment is True when html is just the episode
+    list, not a whole page.
+    """
+    base = _base_of(anime_url)
+    m = _ANIME_ID_RE.search(urlparse(anime_url).path)
+    if m:
+        try:
+            raw = _get_with_retries(
+                _scraper_session(), f"{base}/ajax/v2/episode/list/{m.group(1)}"
+            )
+            payload = json.loads(raw)
+            html = payload.get("html") or ""
+            if html:
+                return html, True
+        except Exception:
+            pass
+    return _rendered_episodes_html(anime_url), False
 
+# Episode lists barely change; cache for a day.
+@_ttl_cached(ttl=24 * 3600)
 def get_episodes_list(anime_url: str) -> List[Tuple[str, str]]:
     """
     Returns sorted list of tuples (ep_num_str, ep_url)
     """
     base = _base_of(anime_url)
-    html = _rendered_html(anime_url)
-    soup = BeautifulSoup(html, "lxml")
-
-    # Try multiple patterns
-    candidates = []
-    for container_sel in ["ul.episodes", "div.episode-list", "div#episodes", "div#episode_page"]:
-        container = soup.select_one(container_sel)
-        if container:
-            candidates = container.select("a[href]")
-            if candidates:
-                break
-    if not candidates:
-        candidates = soup.select("a[href*='episode']")
+    html, is_fragment = _episodes_html(anime_url)
 
+    # Happy path: the AJAX fragment is exactly the episode list, so a
+    # single finditer sweep over it is safe. Full pages go through the
+    # container-scoped parser — a raw sweep there would pick up sidebar
+    # and news anchors as fake episodes.
     episodes = []
-    for a in candidates:
-        href = a.get("href", "").strip()
-        if not href:
-            continue
-        ep_url = _abs(base, href)
-        text = a.get_text(" ", strip=True)
-        # Prefer explicit episode numbers
-        m = re.search(r"Episode\s*([0-9]+)", text, re.I)
-        ep_num = m.group(1) if m else None
-        if not ep_num:
-            # fallback: digits in href
-            m2 = re.search(r"episode[-_/ ]?(\d+)", href, re.I)
-            ep_num = m2.group(1) if m2 else "?"
-        episodes.append((ep_num, ep_url))
-
-    # deduplicate and sort numerically when possible
-    seen = {}
+    if is_fragment:
+        for m in _RE_EP_PAIR.finditer(html):
+            href, body = m.group(1).strip(), m.group(2)
+            if not href:
+                continue
+            m_num = _RE_EP_TEXT.search(body) or _RE_EP_HREF.search(href)
+            episodes.append((m_num.group(1) if m_num else "?", _abs(base, href)))
+
+    if not episodes:
+        for href, text in _episode_anchors(html):
+            ep_url = _abs(base, href)
+            # Prefer explicit episode numbers
+            m = _RE_EP_TEXT.search(text)
+            ep_num = m.group(1) if m else None
+            if not ep_num:
+                # fallback: digits in href
+                m2 = _RE_EP_HREF.search(href)
+                ep_num = m2.group(1) if m2 else "?"
+            episodes.append((ep_num, ep_url))
+
+    # deduplicate by URL and sort numerically when possible
+    seen_urls = set()
+    out = []
     for num, url in episodes:
-        seen[(num, url)] = True
-    episodes = sorted(seen.keys(), key=lambda x: (int(x[0]) if x[0].isdigit() else 10**9, x[1]))
-    return episodes
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
+        out.append((num, url))
+    out.sort(key=lambda x: (int(x[0]) if x[0].isdigit() else 1 << 30, x[1]))
+    return out
 
 # ------------------------
 # 3) EXTRACT HD-2 + ENGLISH SUB
 # ------------------------
+_THREAD_LOCAL = threading.local()
+
 def _scraper_session():
-    s = cloudscraper.create_scraper()
-    s.headers.update(COMMON_HEADERS)
+    """
+    One cloudscraper session per worker thread, so keep-alive connections
+    and solved JS challenges are reused across requests.
+    """
+    s = getattr(_THREAD_LOCAL, "session", None)
+    if s is None:
+        s = cloudscraper.create_scraper()
+        s.headers.update(COMMON_HEADERS)
+        s.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+        _THREAD_LOCAL.session = s
     return s
 
 def _get_with_retries(session, url: str) -> str:
@@ -175,8 +474,57 @@ def _get_with_retries(session, url: str) -> str:
         except Exception as e:
             last = e
             time.sleep(0.4)
+    # The mirror looks unhealthy; force a fresh probe on the next call.
+    _invalidate_base_cache()
     raise last
 
+# HD-2 sub server m3u8 — JSON-ish: {"label":"HD-2","file":"...m3u8","type":"hls"}
+_RE_HD2 = re.compile(r'"label"\s*:\s*"HD-2"\s*,\s*"(?:file|url)"\s*:\s*"([^"]+\.m3u8)"', re.I)
+# English subtitle (common variations):
+# {"srclang":"en","file":"...vtt"} or {"lang":"English","url":"...srt"}
+_RE_SUB_EN = re.compile(
+    r'"srclang"\s*:\s*"en"\s*,\s*"(?:file|url|src)"\s*:\s*"([^"]+\.(?:vtt|srt))"', re.I
+)
+_RE_SUB_EN2 = re.compile(
+    r'"lang"\s*:\s*"English[^"]*"\s*,\s*"(?:file|url|src)"\s*:\s*"([^"]+\.(?:vtt|srt))"', re.I
+)
+
+# Player pages embed the stream data as one JSON object, e.g.
+# window.sources = {"sources":[...],"tracks":[...]};
+_RE_SOURCES_BLOB = re.compile(r"sources\s*=\s*(\{.*?\});", re.S)
+
+def _extract_from_sources_blob(html: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Parse the embedded sources JSON and pick the HD-2 stream plus the
+    English captions track. Returns (None, None) if the blob is absent
+    or malformed.
+    """
+    m = _RE_SOURCES_BLOB.search(html)
+    if not m:
+        return None, None
+    try:
+        data = json.loads(m.group(1))
+    except ValueError:
+        return None, None
+    if not isinstance(data, dict):
+        return None, None
+
+    hls_url = sub_url = None
+    for src in data.get("sources") or []:
+        if isinstance(src, dict) and src.get("label") == "HD-2":
+            hls_url = src.get("file") or src.get("url")
+            break
+    for track in data.get("tracks") or []:
+        if not isinstance(track, dict):
+            continue
+        if track.get("kind") == "captions" and \
+                str(track.get("label", "")).lower().startswith("english"):
+            sub_url = track.get("file") or track.get("src")
+            break
+    return hls_url, sub_url
+
+# The upstream m3u8 URLs are short-lived, so keep this TTL short.
+@_ttl_cached(ttl=600)
 def extract_episode_stream_and_subtitle(episode_url: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Returns (hls_1080p_url, english_sub_url) or (None, None)
@@ -185,17 +533,16 @@ def extract_episode_stream_and_subtitle(episode_url: str) -> Tuple[Optional[str]
     session = _scraper_session()
     html = _get_with_retries(session, episode_url)
 
-    # HD-2 sub server m3u8 — look for variants:
-    # JSON-ish: {"label":"HD-2","file":"...m3u8","type":"hls"}
-    m_hls = re.search(r'"label"\s*:\s*"HD-2"\s*,\s*"(?:file|url)"\s*:\s*"([^"]+\.m3u8)"', html, re.I)
-    hls_url = m_hls.group(1) if m_hls else None
+    # Prefer the structured sources blob; the page-wide regexes stay as
+    # fallback for mirrors that inline the data differently.
+    hls_url, sub_url = _extract_from_sources_blob(html)
 
-    # English subtitle (common variations)
-    # {"srclang":"en","file":"...vtt"} or {"lang":"English","url":"...srt"}
-    m_sub = (
-        re.search(r'"srclang"\s*:\s*"en"\s*,\s*"(?:file|url|src)"\s*:\s*"([^"]+\.(?:vtt|srt))"', html, re.I)
-        or re.search(r'"lang"\s*:\s*"English[^"]*"\s*,\s*"(?:file|url|src)"\s*:\s*"([^"]+\.(?:vtt|srt))"', html, re.I)
-    )
-    sub_url = m_sub.group(1) if m_sub else None
+    if not hls_url:
+        m_hls = _RE_HD2.search(html)
+        hls_url = m_hls.group(1) if m_hls else None
+
+    if not sub_url:
+        m_sub = _RE_SUB_EN.search(html) or _RE_SUB_EN2.search(html)
+        sub_url = m_sub.group(1) if m_sub else None
 
     return hls_url, sub_url
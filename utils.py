@@ -1,19 +1,16 @@
 # utils.py
 
-import os
+from functools import lru_cache
+
 import requests
 
-def download_and_rename_subtitle(subtitle_url: str, ep_num: str, cache_dir: str = "subtitles_cache") -> str:
+@lru_cache(maxsize=64)
+def fetch_subtitle_bytes(subtitle_url: str) -> bytes:
     """
-    Download a .vtt file from subtitle_url and save as "Episode <ep_num>.vtt"
-    in cache_dir. Returns the local path.
+    Download a subtitle file and return its raw bytes. Results are kept in
+    a small LRU cache so repeated requests for the same episode skip the
+    HTTP fetch.
     """
-    os.makedirs(cache_dir, exist_ok=True)
-    local_filename = f"Episode {ep_num}.vtt"
-    local_path = os.path.join(cache_dir, local_filename)
-
     resp = requests.get(subtitle_url, timeout=15)
     resp.raise_for_status()
-    with open(local_path, "wb") as f:
-        f.write(resp.content)
-    return local_path
+    return resp.content